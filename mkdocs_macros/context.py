@@ -19,7 +19,8 @@ import traceback
 from importlib.metadata import version as package_version
 import datetime
 from dateutil.parser import parse as date_parse
-from functools import partial
+from functools import partial, lru_cache
+from copy import copy
 
 import mkdocs
 import jinja2
@@ -190,6 +191,28 @@ def get_git_info():
              'error': str(e)})
 
 
+@lru_cache(maxsize=None)
+def get_environment_info():
+    """
+    Get data on the environment (versions).
+    These do not change while running, so they are calculated only once.
+    """
+    try:
+        return {
+            'system': system_name(),
+            'system_version': system_version(),
+            'python_version': python_version(),
+            'mkdocs_version': mkdocs.__version__,
+            'macros_plugin_version': package_version(PACKAGE_NAME),
+            'jinja2_version': jinja2.__version__,
+            # 'site_git_version': site_git_version(),
+        }
+    except Exception as e:
+        # Avoid breaking the system if error in reading the system info:
+        return ("<i><b>Cannot read system info!</b> %s: %s</i>" %
+                (type(e).__name__, str(e)))
+
+
 def python_version():
     "Get the python version"
     try:
@@ -286,21 +309,8 @@ def define_env(env):
     """
 
     # Get data on the environment (versions)
-    try:
-        environment = {
-            'system': system_name(),
-            'system_version': system_version(),
-            'python_version': python_version(),
-            'mkdocs_version': mkdocs.__version__,
-            'macros_plugin_version': package_version(PACKAGE_NAME),
-            'jinja2_version': jinja2.__version__,
-            # 'site_git_version': site_git_version(),
-        }
-    except Exception as e:
-        # Avoid breaking the system if error in reading the system info:
-        environment = ("<i><b>Cannot read system info!</b> %s: %s</i>" %
-                       (type(e).__name__, str(e)))
-    env.variables['environment'] = environment
+    # (a copy, since the cached value is shared between builds)
+    env.variables['environment'] = copy(get_environment_info())
 
     # configuration of the plugin, in the yaml file:
     env.variables['plugin'] = env.config
@@ -8,9 +8,13 @@
 
 import importlib
 import os
+import re
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
+from functools import cached_property
 
-import yaml
 from jinja2 import (
     Environment, FileSystemLoader, Undefined, DebugUndefined, StrictUndefined,
 )
@@ -24,7 +28,7 @@ from mkdocs.structure.pages import Page
 from mkdocs_macros.errors import format_error
 from mkdocs_macros.context import define_env
 from mkdocs_macros.util import (
-    install_package, parse_package, trace, debug,
+    install_package, parse_package, cached_import, load_yaml_file, trace, debug,
     update, SuperDict, import_local_module, format_chatter, LOG,
 )
 
@@ -58,6 +62,13 @@ UNDEFINED_BEHAVIOR = {'keep': DebugUndefined,
 # see https://stackoverflow.com/a/53134416
 DEFAULT_UNDEFINED_BEHAVIOR = 'keep'
 
+# Newlines, as recognized by jinja2:
+NEWLINE_RE = re.compile(r'(\r\n|\r|\n)')
+
+# Maximum number of compiled templates kept in memory (least recently used
+# are dropped first):
+TEMPLATE_CACHE_SIZE = 512
+
 # Return codes in case of error
 ERROR_MACRO = 100
 
@@ -112,9 +123,20 @@ class MacrosPlugin(BasePlugin):
         ('on_error_fail', PluginType(bool, default=False)),
         ('verbose', PluginType(bool, default=False))
     )
+    # the definitions in config_scheme where key starts with 'j2_',
+    # with the name of the jinja2 parameter (key without prefix):
+    J2_KEYS = tuple((key, key.split('_', 1)[1])
+                    for key, _ in config_scheme if key.startswith('j2_'))
 
     def start_chatting(self, prefix: str, color: str = 'yellow'):
         "Generate a chatter function (trace for macros)"
+        if not self._verbose:
+            # silent, whatever the arguments
+            # (if `verbose` is changed, on_config() runs again
+            # and the modules generate new chatters)
+            return lambda *args: None
+        # bound once, as closure variables:
+        log_info = LOG.info
         def chatter(*args):
             """
             Defines a tracer for the Verbose mode, to be used in macros.
@@ -136,8 +158,7 @@ class MacrosPlugin(BasePlugin):
 
             INFO    -  [macros - Simple module] - This is a dull info message.
             """
-            if self.config['verbose']:
-                LOG.info(format_chatter(*args, prefix=prefix, color=color))
+            log_info(format_chatter(*args, prefix=prefix, color=color))
 
         return chatter
 
@@ -189,9 +210,9 @@ class MacrosPlugin(BasePlugin):
             self._filters = {}
             return self._filters
 
-    @property
+    @cached_property
     def project_dir(self) -> str:
-        "The directory of project"
+        "The directory of project (cached, reset by on_config())"
         # we calculate it from the configuration file
         CONFIG_FILE = self.conf['config_file_path']
         return os.path.dirname(os.path.abspath(CONFIG_FILE))
@@ -279,7 +300,9 @@ class MacrosPlugin(BasePlugin):
             raise ValueError("Value provided to attribute markdown "
                              "should be a string")
         # check whether attribute is accessible:
-        self.markdown
+        if not hasattr(self, '_markdown'):
+            raise AttributeError("Too early: raw markdown is not available"
+                                 "at this stage!")
         self._markdown = value
 
 
@@ -290,9 +313,9 @@ class MacrosPlugin(BasePlugin):
         """
         trace("Property env.raw_markdown is removed "
                              "as of 1.1.0; use env.markdown instead!")
-        return self.markdown(self)
+        return self.markdown
     
-    @markdown.setter
+    @raw_markdown.setter
     def raw_markdown(self, value):
         """
         Used to set the raw markdown
@@ -357,12 +380,22 @@ class MacrosPlugin(BasePlugin):
             raise AttributeError("You called the force_render() method "
                                  "too early. Not initialized yet !") 
 
+    def has_j2_markers(self, text) -> bool:
+        """
+        Predicate: does this text contain any jinja2 start marker
+        (variable, block or comment)?
+        If not, there is nothing to render.
+        """
+        return isinstance(text, str) and any(marker in text
+                                     for marker in self._j2_start_markers)
+
     # -----------------------s-----------
     # load elements
     # ----------------------------------
 
     def _load_yaml(self):
         "Load the the external yaml files"
+        includes = []
         for el in self.config['include_yaml']:
             # el is either a filename or {key: filename} single-entry dict
             try:
@@ -373,17 +406,25 @@ class MacrosPlugin(BasePlugin):
             # Paths are be relative to the project root.
             filename = os.path.join(self.project_dir, filename)
             if os.path.isfile(filename):
-                with open(filename) as f:
-                    # load the yaml file
-                    # NOTE: for the SafeLoader argument, see: https://github.com/yaml/pyyaml/wiki/PyYAML-yaml.load(input)-Deprecation
-                    content = yaml.load(f, Loader=yaml.SafeLoader)
-                    trace("Loading yaml file:", filename)
-                if key is not None:
-                    content = {key: content}
-                update(self.variables, content)
+                includes.append((key, filename))
             else:
                 trace("WARNING: YAML configuration file was not found!",
                       filename)
+        filenames = [filename for _, filename in includes]
+        if len(filenames) > 1:
+            # read and parse the files in parallel (to overlap the I/O),
+            # but merge them in the order of declaration
+            # (later ones override):
+            with ThreadPoolExecutor(max_workers=min(8, len(filenames))) as pool:
+                contents = list(pool.map(load_yaml_file, filenames))
+        else:
+            # nothing to overlap:
+            contents = [load_yaml_file(filename) for filename in filenames]
+        for (key, filename), content in zip(includes, contents):
+            trace("Loading yaml file:", filename)
+            if key is not None:
+                content = {key: content}
+            update(self.variables, content)
 
     def _load_module(self, module, module_name):
         """
@@ -421,8 +462,9 @@ class MacrosPlugin(BasePlugin):
               self.project_dir)
         # execute the hook for the macros
         function_found = False
-        if hasattr(module, 'define_env'):
-            module.define_env(self)
+        define = getattr(module, 'define_env', None)
+        if define is not None:
+            define(self)
             function_found = True
 
         # DECLARE additional event functions
@@ -431,15 +473,15 @@ class MacrosPlugin(BasePlugin):
         def add_function(funcname: str, funclist: list):
             "Add another standard function to the module"
             STANDARD_FUNCTIONS.append(funcname)
-            if hasattr(module, funcname):
+            func = getattr(module, funcname, None)
+            if func is not None:
                 nonlocal function_found
-                func = getattr(module, funcname)
                 funclist.append(func)
                 function_found = True
         add_function('on_pre_page_macros',  self.pre_macro_functions)
         add_function('on_post_page_macros', self.post_macro_functions)
         add_function('on_post_build',       self.post_build_functions)
-        print(STANDARD_FUNCTIONS)
+        debug("Standard functions:", STANDARD_FUNCTIONS)
         if not function_found:
             raise NameError("None of the standard functions was found "
                             "in module '%s':\n%s" %
@@ -459,7 +501,7 @@ class MacrosPlugin(BasePlugin):
             # split the name of package in source (pypi) and module name
             source_name, module_name = parse_package(m)
             try:
-                module = importlib.import_module(module_name)
+                module = cached_import(module_name)
             except ModuleNotFoundError:
                 try:
                     # if absent, install (from pypi)
@@ -527,9 +569,8 @@ class MacrosPlugin(BasePlugin):
 
         # Process meta_variables
         # ----------------------
-        # copy the page variables and update with the meta data
-        # in the YAML header:
-        page_variables = copy(self.variables)
+        # read the meta data in the YAML header of the page
+        # (decide first whether to render, before touching the variables):
         try:
             meta_variables = self.variables['page'].meta
         except KeyError as e:
@@ -555,25 +596,45 @@ class MacrosPlugin(BasePlugin):
         if render_macros == False:
             return markdown
         
-        if self.config['render_by_default'] == False:
+        if self._render_by_default == False:
             # opt-in
             if force_rendering or render_macros == True:
                 pass # opt-in
             else:
                 return markdown
+
+        # nothing to render (no jinja2 markers at all):
+        if not self.has_j2_markers(markdown):
+            # but treat the newlines as jinja2 would: normalize them
+            # and drop the final one (unless kept)
+            lines = NEWLINE_RE.split(markdown)[::2]
+            if not self.env.keep_trailing_newline and lines[-1] == '':
+                del lines[-1]
+            return self.env.newline_sequence.join(lines)
         
-        # Update the page with meta variables
+        # copy the page variables and update them with the meta variables
         # i.e. what's in the yaml header of the page
+        page_variables = self.variables.copy()
         page_variables.update(meta_variables)
 
         # Rendering
         # ----------------------
         # expand the template
-        on_error_fail = self.config['on_error_fail']
+        on_error_fail = self._on_error_fail
         try:
-            md_template = self.env.from_string(markdown)
+            # reuse the compiled template if this markdown was seen before
+            # during the build (e.g. partials rendered several times)
+            template_cache = self._template_cache
+            md_template = template_cache.get(markdown)
+            if md_template is None:
+                md_template = self.env.from_string(markdown)
+                template_cache[markdown] = md_template
+                if len(template_cache) > TEMPLATE_CACHE_SIZE:
+                    template_cache.popitem(last=False)
+            else:
+                template_cache.move_to_end(markdown)
             # Execute the jinja2 template and return
-            return md_template.render(**page_variables)
+            return md_template.render(page_variables)
 
         except Exception as error:
             error_message = format_error(
@@ -584,7 +645,7 @@ class MacrosPlugin(BasePlugin):
 
             trace('ERROR', error_message, level='warning')
             if on_error_fail:
-                exit(ERROR_MACRO)
+                sys.exit(ERROR_MACRO)
 
             else:
                 return error_message
@@ -601,6 +662,10 @@ class MacrosPlugin(BasePlugin):
         """
         # WARNING: this is not the config argument:
         trace("Macros arguments:", self.config)
+        # keep the parameters read on each page (or macro call) at hand:
+        self._render_by_default = self.config['render_by_default']
+        self._on_error_fail = self.config['on_error_fail']
+        self._verbose = self.config['verbose']
         # define the variables and macros as dictionaries
         # (for update function to work):
         self._variables = SuperDict()
@@ -614,6 +679,8 @@ class MacrosPlugin(BasePlugin):
 
         # export the whole data passed as argument, in case of need:
         self._conf = config
+        # the project directory will be recalculated from it:
+        self.__dict__.pop('project_dir', None)
         # add a copy to the template variables
         # that copy may be manipulated
         self.variables['config'] = copy(config)
@@ -674,28 +741,36 @@ class MacrosPlugin(BasePlugin):
         debug("Undefined behavior:", undefined)
         env_config = {
             'loader': FileSystemLoader(include_dir),
-            'undefined': undefined
+            'undefined': undefined,
+            # the environment is rebuilt for each build,
+            # so no need to check the included files for changes:
+            'auto_reload': False,
         }
-        # read the config variables for jinja2:
-        for key, value in self.config.items():
-            # take definitions in config_scheme where key starts with 'j2_'
-            # (if value is not empty)
-            # and forward them to jinja2
-            # this is used for the markers
-            if key.startswith('j2_') and value:
-                variable_name = key.split('_', 1)[1]  # remove prefix
+        # read the config variables for jinja2
+        # (if value is not empty) and forward them to jinja2
+        # this is used for the markers
+        for key, variable_name in self.J2_KEYS:
+            value = self.config[key]
+            if value:
                 trace("Found j2 variable '%s': '%s'" %
                       (variable_name, value))
                 env_config[variable_name] = value
 
         # finally build the environment:
         self.env = Environment(**env_config)
+        # compiled templates, keyed by their source
+        # (reset here, since they depend on the environment):
+        self._template_cache = OrderedDict()
+        # the start markers, to detect text that needs rendering:
+        self._j2_start_markers = (self.env.variable_start_string,
+                                  self.env.block_start_string,
+                                  self.env.comment_start_string)
 
         # -------------------
         # Process macros
         # -------------------
         # reference all macros
-        self.variables['macros'] = copy(self.macros)
+        self.variables['macros'] = SuperDict(self.macros)
         # add the macros to the environment's global (not to the template!)
         self.env.globals.update(self.macros)
 
@@ -705,8 +780,8 @@ class MacrosPlugin(BasePlugin):
         # reference all filters, for doc [these are copies, so no black magic]
         # NOTE: self.variables is reflected in the list of variables
         #       in the jinja2 environment (same object)
-        self.variables['filters'] = copy(self.filters)
-        self.variables['filters_builtin'] = copy(self.env.filters)
+        self.variables['filters'] = self.filters.copy()
+        self.variables['filters_builtin'] = self.env.filters.copy()
         # update environment with the custom filters:
         self.env.filters.update(self.filters)
 
@@ -768,7 +843,8 @@ class MacrosPlugin(BasePlugin):
             # Update the page info in the document
             # page is an object with a number of properties (title, url, ...)
             # see: https://github.com/mkdocs/mkdocs/blob/master/mkdocs/structure/pages.py
-            self.variables["page"] = copy(page)
+            # (templates only read it, so no need for a copy)
+            self.variables["page"] = page
             # Define whether we must force the rendering of this page,
             # based on filename (relative to docs_dir directory)
             filename = page.file.src_path
@@ -789,7 +865,7 @@ class MacrosPlugin(BasePlugin):
             # There is a bizarre issue #215 where setting the title
             # prevents interpretation of icons with pymdownx.emoji
             debug("Page title:",page.title)
-            if "{" in page.title:
+            if self.has_j2_markers(page.title):
                 page.title = self.render(markdown=page.title,
                                         force_rendering=force_rendering)
                 debug("Page title after macro rendering:",page.title)      
@@ -7,9 +7,16 @@ Utilities for mkdocs-macros
 import subprocess
 from copy import deepcopy
 import os, sys, importlib.util
+from functools import lru_cache
 from typing import Literal
 from packaging.version import Version
 
+import yaml
+try:
+    # use the C implementation (libyaml), if available:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from termcolor import colored
 import mkdocs
 
@@ -100,6 +107,7 @@ def format_chatter(*args, prefix:str, color:str=TRACE_COLOR):
 # Packages and modules
 # ------------------------------------------
 
+@lru_cache(maxsize=None)
 def parse_package(package:str):
     """
     Parse a package name
@@ -116,6 +124,16 @@ def parse_package(package:str):
         source_name, package_name = l[:2]
     return source_name, package_name
 
+def cached_import(module_name:str):
+    """
+    Import a module, unless it is already loaded
+    (in which case, return it from sys.modules)
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = importlib.import_module(module_name)
+    return module
+
 def install_package(package:str):
     """
     Install a package from pip
@@ -164,6 +182,15 @@ def import_local_module(project_dir, module_name):
 # ------------------------------------------
 # Utilities
 # ------------------------------------------
+def load_yaml_file(filename:str):
+    """
+    Load a yaml file and return its content
+    """
+    # (read as bytes: the loader takes care of the decoding)
+    with open(filename, 'rb') as f:
+        # NOTE: for the SafeLoader argument, see: https://github.com/yaml/pyyaml/wiki/PyYAML-yaml.load(input)-Deprecation
+        return yaml.load(f, Loader=SafeLoader)
+
 def update(d1, d2):
     """
     Update object d1, with object d2, recursively
@@ -197,6 +224,8 @@ class SuperDict(dict):
 
     except for standard methods
     """
+    # no instance __dict__: everything is in the dictionary itself
+    __slots__ = ()
 
     def __getattr__(self, name):
         "Allow dot notation on reading"
@@ -205,9 +234,8 @@ class SuperDict(dict):
         except KeyError:
             raise AttributeError("Cannot find attribute '%s" % name)
 
-    def __setattr__(self, name, value):
-        "Allow dot notation on writing"
-        self[name] = value
+    # Allow dot notation on writing (directly with the C implementation)
+    __setattr__ = dict.__setitem__
 
 if __name__ == '__main__':
     # test merging of dictionaries